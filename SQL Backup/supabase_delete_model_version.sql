@@ -0,0 +1,25 @@
+-- Run this in the Supabase SQL Editor to create the delete_model_version function.
+-- The ETL script (load_useeio.py) calls it once per run to clear every table of a
+-- model version in a single request and transaction; without it, the script falls
+-- back to one DELETE request per table.
+-- Tables that do not exist yet are skipped, like the script's per-table fallback.
+
+create or replace function delete_model_version(v text)
+returns void
+language plpgsql
+as $$
+declare
+  t text;
+begin
+  foreach t in array array['impacts', 'c', 'rho', 'sector_crosswalk', 'commodities_meta', 'indicators', 'model_metadata'] loop
+    if to_regclass('public.' || t) is not null then
+      execute format('delete from public.%I where model_version = $1', t) using v;
+    end if;
+  end loop;
+end;
+$$;
+
+comment on function delete_model_version(text) is 'Delete all rows of one USEEIO model version from every ETL table in one transaction.';
+
+-- Make the new function visible to the API right away
+notify pgrst, 'reload schema';